@@ -12,15 +12,118 @@
 """
 
 import subprocess
+import asyncio
+import atexit
 import json
+import functools
+import hashlib
 import os
+import queue
+import random
+import re
+import select
+import shutil
+import signal
+import tempfile
 import time
 import sys
+import itertools
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
-from dataclasses import dataclass
+from uuid import uuid4
+from typing import Dict, List, Set, Tuple, Optional
+from dataclasses import dataclass, asdict
 import argparse
 
+try:
+    import numpy as np
+except ImportError:  # numpy 为可选依赖，未安装时逐个计算分数
+    np = None
+
+
+# 处理超时的错误信息（逐级剪枝搜索据此判断是否进入下一级）
+TIMEOUT_ERROR = "处理超时"
+
+# 随机搜索和贝叶斯优化的参数区间（与网格搜索的范围一致）
+SEARCH_SPACE = (
+    ("sample_rate", 1.0, 5.0),
+    ("threshold", 0.25, 0.4),
+    ("min_scene_duration", 0.8, 1.5),
+)
+
+# metadata.json 中 scene_count 字段（位于场景列表之前，只需扫描文件开头）
+SCENE_COUNT_PATTERN = re.compile(rb'"scene_count"\s*:\s*(\d+)')
+SCENE_COUNT_SCAN_BYTES = 65536
+
+# 测试进程放到独立的进程组中，超时或中断时可以终止整个进程组（包括二进制启动的子进程）；
+# 不使用 preexec_fn，Linux 上 CPython 3.10+ 会用 vfork 启动子进程，不复制父进程的页表
+SPAWN_KWARGS = {"process_group": 0} if sys.version_info >= (3, 11) else {"start_new_session": True}
+
+# 视频时长缓存文件（跨运行复用 ffprobe 结果）
+FFPROBE_CACHE_PATH = Path.home() / ".cache" / "velocn" / "ffprobe.json"
+
+
+def _load_json(path: Path) -> Dict:
+    """读取 JSON 缓存文件，文件不存在或损坏时返回空字典"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_json_atomic(path: Path, data: Dict):
+    """写入 JSON 缓存文件（先写临时文件再原子替换，中途中断不会损坏文件）"""
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{path.stem}_", dir=path.parent)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    except OSError:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+
+
+@functools.lru_cache(maxsize=64)
+def _probe_duration(path: str, mtime: float, size: int) -> Optional[float]:
+    """
+    获取视频时长（使用ffprobe）
+    
+    结果按 (路径, 修改时间, 文件大小) 缓存在内存和 FFPROBE_CACHE_PATH 中，视频文件变化后自动失效。
+    
+    Returns:
+        视频时长（秒），获取失败时返回 None
+    """
+    key = f"{path}|{mtime}|{size}"
+    cache = _load_json(FFPROBE_CACHE_PATH)
+    if key in cache:
+        return cache[key]
+    
+    try:
+        cmd = [
+            "ffprobe",
+            "-v", "error",
+            "-show_entries", "format=duration",
+            "-of", "default=noprint_wrappers=1:nokey=1",
+            path
+        ]
+        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        duration = float(result.stdout.strip())
+    except (subprocess.CalledProcessError, ValueError, FileNotFoundError):
+        return None
+    
+    # 缓存写入失败不影响结果
+    try:
+        FFPROBE_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        cache[key] = duration
+        _write_json_atomic(FFPROBE_CACHE_PATH, cache)
+    except OSError:
+        pass
+    
+    return duration
+
 
 @dataclass
 class TestResult:
@@ -38,11 +141,97 @@ class TestResult:
     score: float = 0.0  # 综合得分
 
 
+def export_parquet(results: List[TestResult], path: str):
+    """
+    将全部测试结果导出为 Parquet 文件，便于用 HiPlot 等工具做平行坐标分析、确定参数范围
+    
+    需要安装 pandas 和 pyarrow。
+    """
+    try:
+        import pandas as pd
+    except ImportError as e:
+        raise ImportError("导出 Parquet 需要安装 pandas 和 pyarrow: pip install pandas pyarrow") from e
+    
+    pd.DataFrame([asdict(r) for r in results]).to_parquet(path, index=False)
+
+
+class DistDaemon:
+    """
+    常驻的 dist/main daemon 进程
+    
+    同一个视频的多次测试复用一个进程，通过标准输入/输出逐行交换 JSON 请求和响应，
+    省去每次测试启动进程和初始化运行时的开销（每个请求仍会重新打开视频、初始化解码器并提取音频）。
+    daemon 无法中途取消请求，测试超时时只能终止整个进程，下次测试重新启动。
+    """
+    
+    def __init__(self, binary_path: str, video_path: str):
+        self.proc = subprocess.Popen(
+            [binary_path, "daemon", "--input", video_path],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            # 不缓冲：select 只能看到管道中的数据，看不到 Python 缓冲区里已读入的行
+            bufsize=0,
+            **SPAWN_KWARGS,
+        )
+    
+    @property
+    def pid(self) -> int:
+        return self.proc.pid
+    
+    def run(self, sample_rate: float, threshold: float, min_scene_duration: float,
+            output_dir: Path, timeout: float) -> Dict:
+        """
+        处理一组参数
+        
+        Returns:
+            daemon 的响应: {"success": true, "scene_count": N} 或 {"success": false, "error": "..."}
+        
+        Raises:
+            TimeoutError: 超时未返回响应（此时进程状态未知，调用方应关闭该 daemon）
+            RuntimeError: daemon 进程意外退出
+        """
+        request = {
+            "output": str(output_dir),
+            "sample_rate": sample_rate,
+            "threshold": threshold,
+            "min_scene_duration": min_scene_duration,
+        }
+        self.proc.stdin.write(json.dumps(request).encode() + b"\n")
+        self.proc.stdin.flush()
+        
+        deadline = time.perf_counter() + timeout
+        while True:
+            ready, _, _ = select.select([self.proc.stdout], [], [], max(0, deadline - time.perf_counter()))
+            if not ready:
+                raise TimeoutError(TIMEOUT_ERROR)
+            
+            line = self.proc.stdout.readline()
+            if not line:
+                raise RuntimeError(f"daemon 进程意外退出 (returncode={self.proc.poll()})")
+            
+            # 旧版本二进制的进度信息也会写到标准输出，跳过不是 JSON 对象的行
+            if line.lstrip().startswith(b"{"):
+                try:
+                    return json.loads(line)
+                except ValueError:
+                    pass
+    
+    def close(self):
+        """终止 daemon 进程"""
+        try:
+            os.killpg(self.proc.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+        self.proc.wait()
+
+
 class ParameterOptimizer:
     """参数优化器"""
     
     def __init__(self, video_path: str, binary_path: str = None, target_keyframes: int = 12, 
-                 tolerance: int = 2, max_time_ratio: float = 0.5):
+                 tolerance: int = 2, max_time_ratio: float = 0.5, max_workers: Optional[int] = None,
+                 use_cache: bool = True, use_daemon: bool = False, monotone_prune: bool = True):
         """
         初始化优化器
         
@@ -52,6 +241,10 @@ class ParameterOptimizer:
             target_keyframes: 目标关键帧数量（默认: 12）
             tolerance: 关键帧数量容差（默认: ±2）
             max_time_ratio: 最大处理时间与视频时长的比例（默认: 0.5，即处理时间不超过视频时长的50%）
+            max_workers: 同时运行的最大测试数（默认: min(CPU核数, 组合数)）
+            use_cache: 是否使用测试结果缓存（默认: True，缓存文件: scripts/.optimize_cache.json）
+            use_daemon: 是否复用常驻的 daemon 进程（默认: False，需要二进制支持 daemon 子命令）
+            monotone_prune: 是否跳过关键帧数量必然超出目标范围的组合（默认: True，见 _monotone_pruned）
         """
         self.video_path = Path(video_path)
         if not self.video_path.exists():
@@ -66,9 +259,40 @@ class ParameterOptimizer:
         if not self.binary_path.exists():
             raise FileNotFoundError(f"二进制文件不存在: {self.binary_path}")
         
+        # 启动命令中不变的部分只构建一次；使用绝对路径，启动时不需要搜索 PATH
+        self._binary_exe = str(self.binary_path.resolve())
+        self._process_cmd = [self._binary_exe, "process", "--input", str(self.video_path)]
+        
         self.target_keyframes = target_keyframes
         self.tolerance = tolerance
         self.max_time_ratio = max_time_ratio
+        self.max_workers = max_workers
+        self.monotone_prune = monotone_prune
+        
+        # 测试结果缓存：视频或二进制文件变化后缓存键随之变化，旧结果自动失效
+        video_stat = self.video_path.stat()
+        self._cache_prefix = (f"{self.video_path.resolve()}|{video_stat.st_mtime}|{video_stat.st_size}|"
+                              f"{self.binary_path.stat().st_mtime}")
+        self.use_cache = use_cache
+        self._cache_path = Path(__file__).parent / ".optimize_cache.json"
+        self._cache: Dict[str, Dict] = _load_json(self._cache_path) if use_cache else {}
+        self._cache_lock = threading.Lock()
+        # 当前同时运行的测试数：并发会抬高处理时间，不同并发数测得的结果分开缓存
+        self._workers = 1
+        
+        # 正在运行的测试进程（每个进程是独立进程组的组长），中断时统一终止
+        self._running: Set[int] = set()
+        self._running_lock = threading.Lock()
+        self._stopping = False
+        
+        # 空闲的 daemon 进程，每个并发测试占用一个，退出时统一关闭
+        self.use_daemon = use_daemon
+        self._daemons: "queue.SimpleQueue[DistDaemon]" = queue.SimpleQueue()
+        atexit.register(self._close_daemons)
+        
+        # 所有测试共用一个临时目录，每个测试在其中使用独立的子目录，退出时统一删除
+        self._scratch = Path(tempfile.mkdtemp(prefix="opt_scratch_"))
+        atexit.register(shutil.rmtree, self._scratch, ignore_errors=True)
         
         # 获取视频时长
         self.video_duration = self._get_video_duration()
@@ -78,37 +302,113 @@ class ParameterOptimizer:
         print()
     
     def _get_video_duration(self) -> float:
-        """获取视频时长（使用ffprobe）"""
-        try:
-            cmd = [
-                "ffprobe",
-                "-v", "error",
-                "-show_entries", "format=duration",
-                "-of", "default=noprint_wrappers=1:nokey=1",
-                str(self.video_path)
-            ]
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            return float(result.stdout.strip())
-        except (subprocess.CalledProcessError, ValueError, FileNotFoundError):
+        """获取视频时长（使用ffprobe，结果跨运行缓存）"""
+        video_stat = self.video_path.stat()
+        duration = _probe_duration(str(self.video_path.resolve()), video_stat.st_mtime, video_stat.st_size)
+        if duration is None:
             print("⚠️  无法获取视频时长，使用默认值60秒")
             return 60.0
+        return duration
+    
+    def _save_cache(self):
+        """保存测试结果缓存"""
+        try:
+            _write_json_atomic(self._cache_path, self._cache)
+        except OSError as e:
+            print(f"⚠️  保存缓存失败: {e}")
+    
+    def _cache_key(self, sample_rate: float, threshold: float, min_scene_duration: float) -> str:
+        """
+        计算参数组合的缓存键
+        
+        参数取6位小数，避免浮点运算误差导致同一组合对应不同的键；键中包含当前并发数，
+        以 --max-workers 1 重新运行时不会复用并发测试测得的（偏高的）处理时间。
+        """
+        params = "|".join(str(round(v, 6)) for v in (sample_rate, threshold, min_scene_duration))
+        return hashlib.sha1(f"{self._cache_prefix}|{params}|w{self._workers}".encode()).hexdigest()
     
     def _run_processing(self, sample_rate: float, threshold: float, 
-                       min_scene_duration: float, output_dir: Path) -> Tuple[bool, float, int, Optional[str]]:
+                       min_scene_duration: float, output_dir: Path,
+                       timeout: Optional[float] = None) -> Tuple[bool, float, int, Optional[str]]:
         """
         运行视频处理
         
+        Args:
+            output_dir: 输出目录（由调用方创建）
+            timeout: 超时时间（秒，默认: 视频时长的2倍）
+        
         Returns:
             (success, processing_time, keyframe_count, error_message)
         """
-        # 确保输出目录存在
-        output_dir.mkdir(parents=True, exist_ok=True)
+        if self.use_daemon:
+            return self._run_processing_daemon(sample_rate, threshold, min_scene_duration, output_dir, timeout)
+        
+        return asyncio.run(self._run_processing_async(
+            sample_rate, threshold, min_scene_duration, output_dir, timeout
+        ))
+    
+    def _run_processing_daemon(self, sample_rate: float, threshold: float,
+                               min_scene_duration: float, output_dir: Path,
+                               timeout: Optional[float] = None) -> Tuple[bool, float, int, Optional[str]]:
+        """通过常驻的 daemon 进程运行视频处理（参数和返回值同 _run_processing）"""
+        try:
+            daemon = self._daemons.get_nowait()
+        except queue.Empty:
+            daemon = DistDaemon(self._binary_exe, str(self.video_path))
+            self._track_process(daemon.pid)
         
+        start_time = time.perf_counter()
+        
+        try:
+            response = daemon.run(sample_rate, threshold, min_scene_duration, output_dir,
+                                  timeout or self.video_duration * 2)
+        except TimeoutError:
+            self._discard_daemon(daemon)
+            return False, time.perf_counter() - start_time, 0, TIMEOUT_ERROR
+        except Exception as e:
+            self._discard_daemon(daemon)
+            return False, time.perf_counter() - start_time, 0, str(e)
+        
+        processing_time = time.perf_counter() - start_time
+        self._daemons.put(daemon)
+        
+        if not response.get("success"):
+            return False, processing_time, 0, response.get("error")
+        return True, processing_time, response.get("scene_count", 0), None
+    
+    def _discard_daemon(self, daemon: DistDaemon):
+        """关闭出错或超时的 daemon 进程，下次测试时重新启动"""
+        daemon.close()
+        with self._running_lock:
+            self._running.discard(daemon.pid)
+    
+    def _close_daemons(self):
+        """关闭所有空闲的 daemon 进程"""
+        while True:
+            try:
+                self._discard_daemon(self._daemons.get_nowait())
+            except queue.Empty:
+                break
+    
+    async def _run_processing_async(self, sample_rate: float, threshold: float,
+                                    min_scene_duration: float, output_dir: Path,
+                                    timeout: Optional[float] = None) -> Tuple[bool, float, int, Optional[str]]:
+        """运行视频处理（参数和返回值同 _run_processing）"""
+        outcome = await self._run_binary(sample_rate, threshold, min_scene_duration, output_dir, timeout)
+        return self._collect_output(output_dir, *outcome)
+    
+    async def _run_binary(self, sample_rate: float, threshold: float,
+                          min_scene_duration: float, output_dir: Path,
+                          timeout: Optional[float] = None) -> Tuple[bool, float, Optional[str]]:
+        """
+        运行处理进程并等待其结束（不读取输出目录）
+        
+        Returns:
+            (success, processing_time, error_message)
+        """
         # 构建命令
         cmd = [
-            str(self.binary_path),
-            "process",
-            "--input", str(self.video_path),
+            *self._process_cmd,
             "--output", str(output_dir),
             "--sample-rate", str(sample_rate),
             "--threshold", str(threshold),
@@ -116,73 +416,402 @@ class ParameterOptimizer:
         ]
         
         # 记录开始时间
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
-            # 运行命令，捕获输出
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=self.video_duration * 2,  # 超时时间：视频时长的2倍
+            # 运行命令：标准输出直接丢弃，只保留错误输出用于报告失败原因
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                **SPAWN_KWARGS,
             )
+            self._track_process(proc.pid)
             
-            processing_time = time.time() - start_time
+            try:
+                # 默认超时时间：视频时长的2倍
+                _, stderr = await asyncio.wait_for(proc.communicate(), timeout=timeout or self.video_duration * 2)
+            except asyncio.TimeoutError:
+                self._kill_process_group(proc.pid)
+                await proc.wait()
+                return False, time.perf_counter() - start_time, TIMEOUT_ERROR
+            except asyncio.CancelledError:
+                # 事件循环被中断（如 Ctrl-C）时任务被取消，测试进程收不到终端的 Ctrl-C，需要主动终止
+                self._kill_process_group(proc.pid)
+                await proc.wait()
+                raise
+            finally:
+                with self._running_lock:
+                    self._running.discard(proc.pid)
             
-            if result.returncode != 0:
-                return False, processing_time, 0, result.stderr
+            processing_time = time.perf_counter() - start_time
             
+            if proc.returncode != 0:
+                return False, processing_time, stderr.decode('utf-8', errors='replace')
+            return True, processing_time, None
+                
+        except Exception as e:
+            processing_time = time.perf_counter() - start_time
+            return False, processing_time, str(e)
+    
+    def _collect_output(self, output_dir: Path, success: bool, processing_time: float,
+                        error: Optional[str]) -> Tuple[bool, float, int, Optional[str]]:
+        """读取处理进程的输出目录，统计关键帧数量（返回值同 _run_processing）"""
+        if not success:
+            return False, processing_time, 0, error
+        
+        try:
             # 读取元数据文件获取关键帧数量
             metadata_path = output_dir / "metadata.json"
             if metadata_path.exists():
-                with open(metadata_path, 'r', encoding='utf-8') as f:
-                    metadata = json.load(f)
-                    keyframe_count = metadata.get('scene_count', 0)
-                    return True, processing_time, keyframe_count, None
+                return True, processing_time, self._read_scene_count(metadata_path), None
             else:
                 # 如果没有元数据文件，尝试统计关键帧文件
-                keyframe_files = list(output_dir.glob("keyframe_*.jpg"))
-                return True, processing_time, len(keyframe_files), None
-                
-        except subprocess.TimeoutExpired:
-            processing_time = time.time() - start_time
-            return False, processing_time, 0, "处理超时"
+                with os.scandir(output_dir) as entries:
+                    keyframe_count = sum(
+                        1 for entry in entries
+                        if entry.name.startswith("keyframe_") and entry.name.endswith(".jpg")
+                    )
+                return True, processing_time, keyframe_count, None
         except Exception as e:
-            processing_time = time.time() - start_time
             return False, processing_time, 0, str(e)
     
+    @staticmethod
+    def _kill_process_group(pid: int):
+        """终止测试进程所在的整个进程组"""
+        try:
+            os.killpg(pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+    
+    def _track_process(self, pid: int):
+        """登记正在运行的测试进程；已经开始中断时立即终止（避免中断时恰好启动的进程漏掉）"""
+        with self._running_lock:
+            self._running.add(pid)
+            stopping = self._stopping
+        if stopping:
+            self._kill_process_group(pid)
+    
+    def _kill_running(self):
+        """终止所有正在运行的测试进程，之后启动的测试进程也会立即终止"""
+        with self._running_lock:
+            self._stopping = True
+            pids = list(self._running)
+        for pid in pids:
+            self._kill_process_group(pid)
+    
+    @staticmethod
+    def _read_scene_count(metadata_path: Path) -> int:
+        """读取 metadata.json 中的场景数量（只扫描文件开头，找不到时退回完整解析）"""
+        with open(metadata_path, 'rb') as f:
+            head = f.read(SCENE_COUNT_SCAN_BYTES)
+        
+        match = SCENE_COUNT_PATTERN.search(head)
+        if match:
+            return int(match.group(1))
+        
+        with open(metadata_path, 'r', encoding='utf-8') as f:
+            return json.load(f).get('scene_count', 0)
+    
     def test_parameters(self, sample_rate: float, threshold: float, 
-                      min_scene_duration: float) -> TestResult:
-        """测试一组参数"""
-        output_dir = Path(f"optimize_test_{int(time.time() * 1000)}")
+                      min_scene_duration: float, timeout: Optional[float] = None) -> TestResult:
+        """测试一组参数（命中缓存时直接返回缓存结果）"""
+        cache_key = self._cache_key(sample_rate, threshold, min_scene_duration)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return TestResult(**cached)
+        
+        output_dir = self._new_output_dir()
         
         try:
-            success, processing_time, keyframe_count, error = self._run_processing(
-                sample_rate, threshold, min_scene_duration, output_dir
-            )
-            
-            return TestResult(
-                sample_rate=sample_rate,
-                threshold=threshold,
-                min_scene_duration=min_scene_duration,
-                processing_time=processing_time,
-                keyframe_count=keyframe_count,
-                video_duration=self.video_duration,
-                success=success,
-                error=error
+            outcome = self._run_processing(
+                sample_rate, threshold, min_scene_duration, output_dir, timeout
             )
+            return self._record_result(cache_key, (sample_rate, threshold, min_scene_duration), *outcome)
+        finally:
+            self._clean_output_dir(output_dir)
+    
+    def _new_output_dir(self) -> Path:
+        """
+        创建测试输出目录
+        
+        每次测试使用独立的子目录，避免并发测试之间互相覆盖；
+        父目录在初始化时已创建、名称唯一，直接 os.mkdir，不需要逐级检查父目录。
+        """
+        output_dir = self._scratch / f"t{uuid4().hex}"
+        os.mkdir(output_dir)
+        return output_dir
+    
+    def _record_result(self, cache_key: str, config: Tuple[float, float, float], success: bool,
+                       processing_time: float, keyframe_count: int, error: Optional[str]) -> TestResult:
+        """根据处理结果构建 TestResult，成功时写入缓存"""
+        sample_rate, threshold, min_scene_duration = config
+        result = TestResult(
+            sample_rate=sample_rate,
+            threshold=threshold,
+            min_scene_duration=min_scene_duration,
+            processing_time=processing_time,
+            keyframe_count=keyframe_count,
+            video_duration=self.video_duration,
+            success=success,
+            error=error
+        )
+        
+        # 只缓存成功的结果，超时等失败可能是偶发的
+        if success and self.use_cache:
+            with self._cache_lock:
+                self._cache[cache_key] = asdict(result)
+                self._save_cache()
+        
+        return result
+    
+    @staticmethod
+    def _clean_output_dir(output_dir: Path):
+        """清理测试输出目录（输出只有一层文件，直接逐个删除；出现子目录时退回 rmtree）"""
+        try:
+            with os.scandir(output_dir) as entries:
+                for entry in entries:
+                    os.unlink(entry.path)
+            os.rmdir(output_dir)
+        except FileNotFoundError:
+            pass
+        except OSError:
+            shutil.rmtree(output_dir, ignore_errors=True)
+    
+    def _sweep(self, configs: List[Tuple[float, float, float]],
+               timeout: Optional[float] = None) -> List[TestResult]:
+        """
+        调度一批参数组合
+        
+        参数取6位小数消除浮点运算误差后去重，再按采样率从低到高（处理成本从低到高）排序，
+        让快速的测试先完成：进度输出更有参考价值，中途 Ctrl-C 时也已经有可用的结果。
+        """
+        configs = list(dict.fromkeys(tuple(round(v, 6) for v in config) for config in configs))
+        configs.sort(key=lambda c: (c[0], -c[2], c[1]))
+        return self._run_trials(configs, timeout=timeout)
+    
+    def _run_trials(self, configs: List[Tuple[float, float, float]],
+                    timeout: Optional[float] = None) -> List[TestResult]:
+        """
+        测试一批参数组合
+        
+        组合按顺序逐个提交，提交前跳过根据已完成的结果可以判定关键帧数量必然超出目标范围的组合
+        （见 _monotone_pruned）。同时只运行一个测试进程且不使用 daemon 时流水线调度
+        （见 _run_trials_pipelined），否则用线程池并发调度。
+        
+        Args:
+            configs: (sample_rate, threshold, min_scene_duration) 列表
+            timeout: 每个测试的超时时间（秒，默认: 视频时长的2倍）
+        
+        Returns:
+            测试结果列表（按提交顺序，不包含被跳过的组合）
+        """
+        if not configs:
+            return []
+        
+        max_workers = self.max_workers or min(os.cpu_count() or 1, len(configs))
+        self._workers = max_workers
+        if max_workers == 1 and not self.use_daemon:
+            # 中断时正在运行的任务被取消，测试进程由 _run_binary 终止
+            results, skipped = asyncio.run(self._run_trials_pipelined(configs, timeout))
+        else:
+            results, skipped = self._run_trials_threaded(configs, max_workers, timeout)
+        
+        if skipped:
+            print(f"⏭️  单调剪枝: 跳过 {skipped} 组关键帧数量必然超出目标范围的参数组合")
+            print()
+        
+        return results
+    
+    def _run_trials_threaded(self, configs: List[Tuple[float, float, float]], max_workers: int,
+                             timeout: Optional[float] = None) -> Tuple[List[TestResult], int]:
+        """
+        用线程池并发测试一批参数组合
+        
+        每个测试都是独立的子进程，直接用线程池并发调度（同时运行的不超过 max_workers 个）；
+        进度在结果返回时按完成顺序输出。
+        
+        Returns:
+            (测试结果列表, 被跳过的组合数)
+        """
+        total_tests = len(configs)
+        results: List[Optional[TestResult]] = [None] * total_tests
+        pending = deque(enumerate(configs))
+        running: Dict[Future, int] = {}
+        finished: List[TestResult] = []
+        skipped = 0
+        current_test = 0
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            try:
+                while pending or running:
+                    while pending and len(running) < max_workers:
+                        index, config = pending.popleft()
+                        if self.monotone_prune and self._monotone_pruned(config, finished):
+                            skipped += 1
+                            continue
+                        running[executor.submit(self.test_parameters, *config, timeout=timeout)] = index
+                    
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        result = future.result()
+                        results[running.pop(future)] = result
+                        if result.success:
+                            finished.append(result)
+                        current_test += 1
+                        self._print_result(result, current_test, total_tests - skipped)
+            except KeyboardInterrupt:
+                # 测试进程在独立的进程组中运行，收不到终端的 Ctrl-C，需要主动终止
+                executor.shutdown(wait=False, cancel_futures=True)
+                self._kill_running()
+                raise
+        
+        return [r for r in results if r is not None], skipped
+    
+    async def _run_trials_pipelined(self, configs: List[Tuple[float, float, float]],
+                                    timeout: Optional[float] = None) -> Tuple[List[TestResult], int]:
+        """
+        流水线测试一批参数组合（同时只运行一个测试进程）
+        
+        生产者逐个启动测试进程并等待其结束，随即启动下一个；消费者在线程中读取上一个测试的输出、
+        清理输出目录，与下一个测试进程的运行重叠。队列长度为1，消费者跟不上时生产者暂停。
+        
+        Returns:
+            (测试结果列表, 被跳过的组合数)
+        """
+        trials: asyncio.Queue = asyncio.Queue(maxsize=1)
+        results: List[TestResult] = []
+        finished: List[TestResult] = []
+        skipped = 0
+        
+        async def produce():
+            nonlocal skipped
+            for config in configs:
+                # 上一个测试可能还在消费者中处理，剪枝只参考已处理完的结果
+                if self.monotone_prune and self._monotone_pruned(config, finished):
+                    skipped += 1
+                    continue
+                
+                cache_key = self._cache_key(*config)
+                cached = self._cache.get(cache_key)
+                if cached is not None:
+                    await trials.put(TestResult(**cached))
+                    continue
+                
+                output_dir = self._new_output_dir()
+                outcome = await self._run_binary(*config, output_dir, timeout)
+                await trials.put((cache_key, config, output_dir, outcome))
+            await trials.put(None)
+        
+        async def consume():
+            while True:
+                trial = await trials.get()
+                if trial is None:
+                    return
+                
+                if isinstance(trial, TestResult):
+                    result = trial
+                else:
+                    result = await asyncio.to_thread(self._finish_trial, *trial)
+                
+                results.append(result)
+                if result.success:
+                    finished.append(result)
+                self._print_result(result, len(results), len(configs) - skipped)
+        
+        await asyncio.gather(produce(), consume())
+        return results, skipped
+    
+    def _finish_trial(self, cache_key: str, config: Tuple[float, float, float], output_dir: Path,
+                      outcome: Tuple[bool, float, Optional[str]]) -> TestResult:
+        """读取流水线中已结束测试的输出并清理输出目录"""
+        try:
+            return self._record_result(cache_key, config, *self._collect_output(output_dir, *outcome))
         finally:
-            # 清理临时输出目录
-            if output_dir.exists():
-                import shutil
-                shutil.rmtree(output_dir, ignore_errors=True)
+            self._clean_output_dir(output_dir)
+    
+    def _monotone_pruned(self, config: Tuple[float, float, float], finished: List[TestResult]) -> bool:
+        """
+        根据已完成的结果判断参数组合的关键帧数量是否必然超出目标范围
+        
+        采样率相同时，提高阈值或最小场景持续时间都只会减少场景数量（场景检测要求帧差异超过阈值，
+        且与上一个场景的间隔不小于最小场景持续时间）。已有结果关键帧过少时，阈值和最小场景持续时间
+        都不低于它的组合只会更少；关键帧过多时，两者都不高于它的组合只会更多。
+        """
+        sample_rate, threshold, min_scene_duration = config
+        min_keyframes = self.target_keyframes - self.tolerance
+        max_keyframes = self.target_keyframes + self.tolerance
+        
+        for result in finished:
+            if result.sample_rate != sample_rate:
+                continue
+            if (result.keyframe_count < min_keyframes and
+                    threshold >= result.threshold and min_scene_duration >= result.min_scene_duration):
+                return True
+            if (result.keyframe_count > max_keyframes and
+                    threshold <= result.threshold and min_scene_duration <= result.min_scene_duration):
+                return True
+        
+        return False
     
-    def optimize(self, strategy: str = "grid_search") -> List[TestResult]:
+    def _keyframe_diff_lower_bound(self, config: Tuple[float, float, float], finished: List[TestResult]) -> int:
+        """
+        根据已完成的结果估计参数组合关键帧差异的下界
+        
+        依据与 _monotone_pruned 相同的单调性：阈值和最小场景持续时间都不高于某个结果的组合，
+        关键帧数量不少于该结果；都不低于的组合不多于该结果。关闭单调剪枝时不做假设，下界为0。
+        """
+        if not self.monotone_prune:
+            return 0
+        
+        sample_rate, threshold, min_scene_duration = config
+        low, high = 0, None
+        for result in finished:
+            if result.sample_rate != sample_rate:
+                continue
+            if threshold <= result.threshold and min_scene_duration <= result.min_scene_duration:
+                low = max(low, result.keyframe_count)
+            if threshold >= result.threshold and min_scene_duration >= result.min_scene_duration:
+                high = result.keyframe_count if high is None else min(high, result.keyframe_count)
+        
+        if low > self.target_keyframes:
+            return low - self.target_keyframes
+        if high is not None and high < self.target_keyframes:
+            return self.target_keyframes - high
+        return 0
+    
+    def _print_result(self, result: TestResult, current_test: int, total_tests: int):
+        """输出单个测试结果"""
+        print(f"[{current_test}/{total_tests}] 测试参数: "
+              f"sample_rate={result.sample_rate:.1f}, "
+              f"threshold={result.threshold:.2f}, "
+              f"min_scene_duration={result.min_scene_duration:.1f}")
+        
+        if result.success:
+            time_ratio = result.processing_time / result.video_duration
+            keyframe_diff = abs(result.keyframe_count - self.target_keyframes)
+            
+            status = "✓"
+            if keyframe_diff <= self.tolerance and time_ratio <= self.max_time_ratio:
+                status = "⭐"  # 优秀
+            
+            print(f"   {status} 耗时: {result.processing_time:.2f}s "
+                  f"({time_ratio*100:.1f}% 视频时长) | "
+                  f"关键帧: {result.keyframe_count} | "
+                  f"差异: {keyframe_diff}")
+        else:
+            print(f"   ✗ 失败: {result.error}")
+        
+        print()
+    
+    def optimize(self, strategy: str = "random", n_iter: int = 30, seed: int = 0) -> List[TestResult]:
         """
         优化参数
         
         Args:
-            strategy: 优化策略 ("grid_search" 或 "adaptive")
+            strategy: 优化策略 ("random"、"tpe"、"grid_search" 或 "adaptive")
+            n_iter: 随机搜索和贝叶斯优化的测试次数（默认: 30）
+            seed: 随机搜索和贝叶斯优化的随机种子（默认: 0）
         
         Returns:
             测试结果列表
@@ -190,17 +819,92 @@ class ParameterOptimizer:
         print("🔍 开始参数优化...")
         print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
         
-        if strategy == "grid_search":
+        if strategy == "random":
+            return self._random_search(n_iter=n_iter, seed=seed)
+        elif strategy == "tpe":
+            return self._tpe_search(n_trials=n_iter, seed=seed)
+        elif strategy == "grid_search":
             return self._grid_search()
         elif strategy == "adaptive":
             return self._adaptive_search()
         else:
             raise ValueError(f"未知的优化策略: {strategy}")
     
-    def _grid_search(self) -> List[TestResult]:
-        """网格搜索策略"""
+    def _random_search(self, n_iter: int = 30, seed: int = 0) -> List[TestResult]:
+        """
+        随机搜索策略（拉丁超立方采样）
+        
+        在连续区间内采样，同样的测试次数下通常比网格搜索更接近最优；
+        安装了 scipy 时使用拉丁超立方采样，否则退化为均匀随机采样。
+        """
+        try:
+            from scipy.stats import qmc
+            samples = qmc.LatinHypercube(d=len(SEARCH_SPACE), seed=seed).random(n_iter)
+        except ImportError:
+            rng = random.Random(seed)
+            samples = [[rng.random() for _ in SEARCH_SPACE] for _ in range(n_iter)]
+        
+        # 保留两位小数，与推荐命令的输出精度一致
+        configs = [
+            tuple(round(low + u * (high - low), 2) for u, (_, low, high) in zip(sample, SEARCH_SPACE))
+            for sample in samples
+        ]
+        
+        print(f"📊 随机搜索: {len(configs)} 组参数组合")
+        print()
+        
+        return self._sweep(configs)
+    
+    def _tpe_search(self, n_trials: int = 30, seed: int = 0) -> List[TestResult]:
+        """
+        贝叶斯优化策略（Optuna TPE）
+        
+        以 _calculate_score 为目标函数，根据已有结果选择下一组参数，通常比随机搜索用更少的测试接近最优。
+        需要安装 optuna；测试结果仍经过缓存，中断后重新运行时已测试的参数不会重复处理。
+        """
+        try:
+            import optuna
+        except ImportError as e:
+            raise ImportError("tpe 策略需要安装 optuna: pip install optuna") from e
+        
+        optuna.logging.set_verbosity(optuna.logging.WARNING)
+        study = optuna.create_study(direction="maximize", sampler=optuna.samplers.TPESampler(seed=seed))
+        
         results = []
+        results_lock = threading.Lock()
+        
+        def objective(trial) -> float:
+            # 步长0.01，与推荐命令的输出精度一致
+            params = [round(trial.suggest_float(name, low, high, step=0.01), 2) for name, low, high in SEARCH_SPACE]
+            result = self.test_parameters(*params)
+            with results_lock:
+                results.append(result)
+                self._print_result(result, len(results), n_trials)
+            # 失败的测试得分低于任何成功的结果（分数范围 0~100）
+            return self._evaluate(result).score if result.success else -1.0
+        
+        def on_interrupt(signum, frame):
+            # 测试进程在独立的进程组中运行，收不到终端的 Ctrl-C；Optuna 的线程池在抛出
+            # KeyboardInterrupt 前会等待正在运行的测试结束，需要在信号处理函数中先终止测试进程
+            self._kill_running()
+            signal.default_int_handler(signum, frame)
+        
+        print(f"📊 贝叶斯优化: {n_trials} 次测试")
+        print()
+        
+        n_jobs = self.max_workers or min(os.cpu_count() or 1, n_trials)
+        self._workers = n_jobs
         
+        previous_handler = signal.signal(signal.SIGINT, on_interrupt)
+        try:
+            study.optimize(objective, n_trials=n_trials, n_jobs=n_jobs)
+        finally:
+            signal.signal(signal.SIGINT, previous_handler)
+        
+        return results
+    
+    def _grid_search(self) -> List[TestResult]:
+        """网格搜索策略"""
         # 定义参数范围
         # 采样率：从低到高，重点关注低采样率（因为高采样率太慢）
         sample_rates = [1.0, 1.5, 2.0, 2.5, 3.0, 4.0, 5.0]
@@ -211,48 +915,102 @@ class ParameterOptimizer:
         # 最小场景持续时间：常用范围
         min_scene_durations = [0.8, 1.0, 1.2, 1.5]
         
-        total_tests = len(sample_rates) * len(thresholds) * len(min_scene_durations)
-        current_test = 0
+        configs = list(itertools.product(sample_rates, thresholds, min_scene_durations))
         
-        print(f"📊 网格搜索: {total_tests} 组参数组合")
+        print(f"📊 网格搜索: {len(configs)} 组参数组合")
         print()
         
-        for sample_rate in sample_rates:
-            for threshold in thresholds:
-                for min_scene_duration in min_scene_durations:
-                    current_test += 1
-                    
-                    print(f"[{current_test}/{total_tests}] 测试参数: "
-                          f"sample_rate={sample_rate:.1f}, "
-                          f"threshold={threshold:.2f}, "
-                          f"min_scene_duration={min_scene_duration:.1f}")
-                    
-                    result = self.test_parameters(sample_rate, threshold, min_scene_duration)
-                    results.append(result)
-                    
-                    if result.success:
-                        time_ratio = result.processing_time / result.video_duration
-                        keyframe_diff = abs(result.keyframe_count - self.target_keyframes)
-                        
-                        status = "✓"
-                        if keyframe_diff <= self.tolerance and time_ratio <= self.max_time_ratio:
-                            status = "⭐"  # 优秀
-                        
-                        print(f"   {status} 耗时: {result.processing_time:.2f}s "
-                              f"({time_ratio*100:.1f}% 视频时长) | "
-                              f"关键帧: {result.keyframe_count} | "
-                              f"差异: {keyframe_diff}")
-                    else:
-                        print(f"   ✗ 失败: {result.error}")
-                    
-                    print()
+        return self._successive_halving(configs)
+    
+    def _successive_halving(self, configs: List[Tuple[float, float, float]],
+                            rungs: Optional[Tuple[Tuple[float, Optional[int]], ...]] = None
+                            ) -> List[TestResult]:
+        """
+        逐级放宽超时时间的剪枝搜索（Successive Halving）
+        
+        二进制不支持只处理部分视频，测试在时间预算内完成即为最终结果，只有超时的组合才进入下一级
+        （从头重新处理）。第1级以 max_time_ratio 为预算测试全部组合，处理时间在可接受范围内的组合
+        都能完成；进入下一级的组合处理时间已经超出 max_time_ratio，不可能成为最优结果：
+        
+        - 已有最优结果（关键帧数量在容差内且处理时间不超过 max_time_ratio）时，不再测试超时的组合
+        - 否则 analyze_results 按关键帧差异选择最接近的结果，差异相同时处理时间短的优先；超时的组合
+          处理时间一定更长，关键帧差异的下界（见 _keyframe_diff_lower_bound）不小于当前最小差异时剪枝，
+          剩余组合按差异下界排序（相同时保持 _sweep 的顺序，即采样率从低到高）保留至多 keep_n 个
+        
+        最后一级的预算为默认超时时间（视频时长的2倍）。
+        
+        Args:
+            configs: 参数组合列表
+            rungs: (超时时间与视频时长的比例, 保留数量) 列表，保留数量为 None 表示全部保留
+                   （默认: (max_time_ratio, 全部), (两者之间, 16), (2.0, 4)）
+        
+        Returns:
+            测试结果列表（被剪枝的组合标记为失败）
+        """
+        if rungs is None:
+            if self.max_time_ratio >= 2.0:
+                rungs = ((self.max_time_ratio, None),)
+            else:
+                rungs = ((self.max_time_ratio, None), ((self.max_time_ratio + 2.0) / 2, 16), (2.0, 4))
+        
+        results = []
+        pending = list(configs)
+        pruned = []
+        spent_ratio = 0.0
+        
+        for rung, (budget_ratio, keep_n) in enumerate(rungs, 1):
+            if rung > 1 and pending:
+                finished = [self._evaluate(r) for r in results if r.success]
+                if any(r.keyframe_diff <= self.tolerance and r.time_ratio <= self.max_time_ratio
+                       for r in finished):
+                    break
+                
+                best_diff = min((r.keyframe_diff for r in finished), default=None)
+                bounds = {config: self._keyframe_diff_lower_bound(config, finished) for config in pending}
+                if best_diff is not None:
+                    pruned.extend(c for c in pending if bounds[c] >= best_diff)
+                    pending = [c for c in pending if bounds[c] < best_diff]
+                
+                if keep_n is not None:
+                    pending.sort(key=bounds.__getitem__)
+                    pruned.extend(pending[keep_n:])
+                    pending = pending[:keep_n]
+            
+            if not pending:
+                break
+            
+            timeout = self.video_duration * budget_ratio
+            print(f"📊 第{rung}级: {len(pending)} 组参数，超时时间 {timeout:.1f}s")
+            print()
+            
+            pending_results = self._sweep(pending, timeout=timeout)
+            spent_ratio = budget_ratio
+            results.extend(r for r in pending_results if r.error != TIMEOUT_ERROR)
+            pending = [
+                (r.sample_rate, r.threshold, r.min_scene_duration)
+                for r in pending_results if r.error == TIMEOUT_ERROR
+            ]
+        
+        # 剩余未完成的组合全部剪枝
+        pruned.extend(pending)
+        results.extend(
+            TestResult(
+                sample_rate=sample_rate,
+                threshold=threshold,
+                min_scene_duration=min_scene_duration,
+                processing_time=self.video_duration * spent_ratio,
+                keyframe_count=0,
+                video_duration=self.video_duration,
+                success=False,
+                error="已剪枝",
+            )
+            for sample_rate, threshold, min_scene_duration in pruned
+        )
         
         return results
     
     def _adaptive_search(self) -> List[TestResult]:
         """自适应搜索策略（先粗后细）"""
-        results = []
-        
         # 第一阶段：粗搜索，找到大致范围
         print("📊 第一阶段：粗搜索")
         print()
@@ -261,33 +1019,17 @@ class ParameterOptimizer:
         coarse_thresholds = [0.25, 0.3, 0.35]
         coarse_min_scene_durations = [0.8, 1.0, 1.5]
         
-        best_results = []
+        results = self._sweep(list(itertools.product(
+            coarse_sample_rates, coarse_thresholds, coarse_min_scene_durations
+        )))
         
-        for sample_rate in coarse_sample_rates:
-            for threshold in coarse_thresholds:
-                for min_scene_duration in coarse_min_scene_durations:
-                    print(f"测试: sample_rate={sample_rate:.1f}, "
-                          f"threshold={threshold:.2f}, "
-                          f"min_scene_duration={min_scene_duration:.1f}")
-                    
-                    result = self.test_parameters(sample_rate, threshold, min_scene_duration)
-                    results.append(result)
-                    
-                    if result.success:
-                        time_ratio = result.processing_time / result.video_duration
-                        keyframe_diff = abs(result.keyframe_count - self.target_keyframes)
-                        
-                        # 筛选出符合条件的结果
-                        if keyframe_diff <= self.tolerance * 2 and time_ratio <= self.max_time_ratio * 1.5:
-                            best_results.append(result)
-                            print(f"   ✓ 耗时: {result.processing_time:.2f}s | "
-                                  f"关键帧: {result.keyframe_count}")
-                        else:
-                            print(f"   - 耗时: {result.processing_time:.2f}s | "
-                                  f"关键帧: {result.keyframe_count} (不符合条件)")
-                    else:
-                        print(f"   ✗ 失败: {result.error}")
-                    print()
+        # 筛选出符合条件的结果
+        best_results = [
+            r for r in results
+            if r.success
+            and abs(r.keyframe_count - self.target_keyframes) <= self.tolerance * 2
+            and r.processing_time / r.video_duration <= self.max_time_ratio * 1.5
+        ]
         
         if not best_results:
             print("⚠️  第一阶段未找到符合条件的结果，返回所有结果")
@@ -330,28 +1072,14 @@ class ParameterOptimizer:
             min(2.0, best_result.min_scene_duration + 0.2),
         ]
         
-        for sample_rate in fine_sample_rates:
-            for threshold in fine_thresholds:
-                for min_scene_duration in fine_min_scene_durations:
-                    # 跳过已经测试过的组合
-                    if (sample_rate == best_result.sample_rate and
-                        threshold == best_result.threshold and
-                        min_scene_duration == best_result.min_scene_duration):
-                        continue
-                    
-                    print(f"精细测试: sample_rate={sample_rate:.1f}, "
-                          f"threshold={threshold:.2f}, "
-                          f"min_scene_duration={min_scene_duration:.1f}")
-                    
-                    result = self.test_parameters(sample_rate, threshold, min_scene_duration)
-                    results.append(result)
-                    
-                    if result.success:
-                        print(f"   ✓ 耗时: {result.processing_time:.2f}s | "
-                              f"关键帧: {result.keyframe_count}")
-                    else:
-                        print(f"   ✗ 失败: {result.error}")
-                    print()
+        # 跳过已经测试过的组合
+        tested_keys = {self._cache_key(r.sample_rate, r.threshold, r.min_scene_duration) for r in results}
+        fine_configs = [
+            config
+            for config in itertools.product(fine_sample_rates, fine_thresholds, fine_min_scene_durations)
+            if self._cache_key(*config) not in tested_keys
+        ]
+        results.extend(self._sweep(fine_configs))
         
         return results
     
@@ -372,13 +1100,7 @@ class ParameterOptimizer:
         print()
         
         # 计算各项指标
-        for result in successful_results:
-            result.time_ratio = result.processing_time / result.video_duration
-            result.keyframe_diff = abs(result.keyframe_count - self.target_keyframes)
-            result.score = self._calculate_score(result)
-        
-        # 按分数排序
-        successful_results.sort(key=lambda r: r.score, reverse=True)
+        self._evaluate_all(successful_results)
         
         # 找到最优结果（关键帧数量符合要求，且处理时间最短）
         optimal_results = [
@@ -386,14 +1108,16 @@ class ParameterOptimizer:
             if r.keyframe_diff <= self.tolerance and r.time_ratio <= self.max_time_ratio
         ]
         
+        # 只排序一次：有符合条件的结果时按分数排序，最优结果直接取最小值；
+        # 否则按与目标的接近程度排序，第一个即为最接近的结果
         if optimal_results:
-            optimal_results.sort(key=lambda r: (r.keyframe_diff, r.processing_time))
-            best_result = optimal_results[0]
+            best_result = min(optimal_results, key=lambda r: (r.keyframe_diff, r.processing_time))
+            successful_results.sort(key=lambda r: -r.score)
         else:
-            # 如果没有完全符合条件的结果，选择最接近的
             successful_results.sort(key=lambda r: (
                 r.keyframe_diff,
-                r.time_ratio if r.time_ratio <= self.max_time_ratio * 1.5 else float('inf')
+                r.time_ratio if r.time_ratio <= self.max_time_ratio * 1.5 else float('inf'),
+                -r.score,  # 接近程度相同时按分数排序
             ))
             best_result = successful_results[0]
         
@@ -456,6 +1180,43 @@ class ParameterOptimizer:
             ]
         }
     
+    def _evaluate(self, result: TestResult) -> TestResult:
+        """计算结果的时间占比、关键帧差异和分数"""
+        result.time_ratio = result.processing_time / result.video_duration
+        result.keyframe_diff = abs(result.keyframe_count - self.target_keyframes)
+        result.score = self._calculate_score(result)
+        return result
+    
+    def _evaluate_all(self, results: List[TestResult]):
+        """
+        批量计算结果的时间占比、关键帧差异和分数
+        
+        安装了 numpy 时向量化计算（公式与 _calculate_score 一致），否则逐个调用 _evaluate。
+        """
+        if np is None or not results:
+            for result in results:
+                self._evaluate(result)
+            return
+        
+        arr = np.array(
+            [(r.processing_time, r.keyframe_count, r.video_duration) for r in results],
+            dtype=[('t', 'f8'), ('k', 'i8'), ('d', 'f8')],
+        )
+        time_ratio = arr['t'] / arr['d']
+        keyframe_diff = np.abs(arr['k'] - self.target_keyframes)
+        keyframe_score = np.maximum(0, 100 - keyframe_diff * 10)
+        time_score = np.where(
+            time_ratio <= self.max_time_ratio,
+            100 * (1 - time_ratio / self.max_time_ratio),
+            np.maximum(0, 100 - (time_ratio - self.max_time_ratio) * 200),
+        )
+        scores = keyframe_score * 0.6 + time_score * 0.4
+        
+        for result, ratio, diff, score in zip(results, time_ratio.tolist(), keyframe_diff.tolist(), scores.tolist()):
+            result.time_ratio = ratio
+            result.keyframe_diff = diff
+            result.score = score
+    
     def _calculate_score(self, result: TestResult) -> float:
         """计算结果分数（越高越好）"""
         # 关键帧数量得分（越接近目标越好）
@@ -483,11 +1244,20 @@ def main():
   # 指定目标关键帧数量和容差
   python scripts/optimize_params.py input.mov --target-keyframes 12 --tolerance 2
 
-  # 使用自适应搜索策略（更快）
+  # 使用自适应搜索策略
   python scripts/optimize_params.py input.mov --strategy adaptive
 
+  # 随机搜索（默认）：指定测试次数和随机种子
+  python scripts/optimize_params.py input.mov --n-iter 50 --seed 1
+
+  # 贝叶斯优化（需要安装 optuna）
+  python scripts/optimize_params.py input.mov --strategy tpe --n-iter 20
+
   # 指定二进制文件路径
   python scripts/optimize_params.py input.mov --binary ./dist/main
+
+  # 串行测试（处理时间测量更准确）
+  python scripts/optimize_params.py input.mov --max-workers 1
         """
     )
     
@@ -497,13 +1267,35 @@ def main():
     parser.add_argument("--tolerance", type=int, default=2, help="关键帧数量容差（默认: ±2）")
     parser.add_argument("--max-time-ratio", type=float, default=0.5, 
                        help="最大处理时间与视频时长的比例（默认: 0.5，即50%%）")
-    parser.add_argument("--strategy", choices=["grid_search", "adaptive"], default="adaptive",
-                       help="优化策略（默认: adaptive）")
+    parser.add_argument("--strategy", choices=["random", "tpe", "grid_search", "adaptive"], default="random",
+                       help="优化策略（默认: random）")
+    parser.add_argument("--n-iter", type=int, default=30, help="随机搜索和贝叶斯优化的测试次数（默认: 30）")
+    parser.add_argument("--seed", type=int, default=0, help="随机搜索和贝叶斯优化的随机种子（默认: 0）")
+    parser.add_argument("--max-workers", type=int, default=None,
+                       help="同时运行的最大测试数（默认: min(CPU核数, 组合数)；并发会互相争用CPU，处理时间会偏高，"
+                            "不同并发数的测试结果分开缓存）")
+    parser.add_argument("--daemon", action="store_true",
+                       help="复用常驻的 daemon 进程，省去每次测试启动二进制的开销（需要二进制支持 daemon 子命令；"
+                            "超时的测试会终止所在的 daemon，网格搜索中较慢的组合较多时收益有限）")
+    parser.add_argument("--no-monotone-prune", action="store_true",
+                       help="不跳过关键帧数量必然超出目标范围的组合（默认根据已完成的结果跳过）")
+    parser.add_argument("--no-cache", action="store_true",
+                       help="不使用测试结果缓存（默认缓存到 scripts/.optimize_cache.json）")
     parser.add_argument("--output", default=None,
                        help="结果输出文件（默认: scripts/optimize_results.json）")
+    parser.add_argument("--parquet", action="store_true",
+                       help="同时将全部测试结果导出为 Parquet 文件（与 --output 同名，扩展名为 .parquet；需要 pandas 和 pyarrow）")
     
     args = parser.parse_args()
     
+    # 导出 Parquet 的依赖在测试开始前检查，避免全部测试完成后才失败
+    if args.parquet:
+        try:
+            import pandas  # noqa: F401
+            import pyarrow  # noqa: F401
+        except ImportError:
+            parser.error("--parquet 需要安装 pandas 和 pyarrow: pip install pandas pyarrow")
+    
     # 设置默认输出路径
     if args.output is None:
         script_dir = Path(__file__).parent
@@ -516,9 +1308,13 @@ def main():
             target_keyframes=args.target_keyframes,
             tolerance=args.tolerance,
             max_time_ratio=args.max_time_ratio,
+            max_workers=args.max_workers,
+            use_cache=not args.no_cache,
+            use_daemon=args.daemon,
+            monotone_prune=not args.no_monotone_prune,
         )
         
-        results = optimizer.optimize(strategy=args.strategy)
+        results = optimizer.optimize(strategy=args.strategy, n_iter=args.n_iter, seed=args.seed)
         analysis = optimizer.analyze_results(results)
         
         # 保存结果到JSON文件
@@ -527,6 +1323,11 @@ def main():
                 json.dump(analysis, f, indent=2, ensure_ascii=False)
             print(f"💾 结果已保存到: {args.output}")
         
+        if args.parquet:
+            parquet_path = str(Path(args.output).with_suffix(".parquet"))
+            export_parquet(results, parquet_path)
+            print(f"💾 全部测试结果已导出到: {parquet_path}")
+        
         return 0
         
     except Exception as e:
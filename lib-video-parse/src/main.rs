@@ -1,6 +1,8 @@
 use clap::{Parser, Subcommand};
 use anyhow::{Context, Result};
-use std::path::PathBuf;
+use serde::Deserialize;
+use tokio::io::{AsyncBufReadExt, AsyncWriteExt, BufReader};
+use std::path::{Path, PathBuf};
 use video_parse::{ProcessConfig, process_video, config::ConfigLoader};
 
 /// 视频拉片工具 - 分析视频内容，提取关键帧和场景信息
@@ -44,6 +46,19 @@ enum Commands {
         #[arg(long)]
         sample_rate: Option<f64>,
     },
+    /// 常驻模式：从标准输入逐行读取 JSON 请求，反复处理同一个视频（供参数优化脚本复用进程）
+    ///
+    /// 请求: {"output": "...", "threshold": 0.3, "min_scene_duration": 1.0, "sample_rate": 2.0}
+    /// 响应: {"success": true, "scene_count": 12} 或 {"success": false, "error": "..."}
+    Daemon {
+        /// 输入视频文件路径
+        #[arg(short, long)]
+        input: String,
+
+        /// 配置文件路径（可选，支持 .ini 格式）
+        #[arg(long)]
+        config: Option<PathBuf>,
+    },
     /// Web 服务模式：启动 HTTP 服务器处理 OSS event
     Serve {
         /// 监听地址（默认从环境变量 FC_SERVER_PORT 读取，如果不存在则使用 0.0.0.0:9000）
@@ -54,11 +69,15 @@ enum Commands {
 
 #[tokio::main]
 async fn main() -> Result<()> {
-    // 初始化日志
-    tracing_subscriber::fmt::init();
-
     let args = Args::parse();
 
+    // 初始化日志（常驻模式的标准输出用于返回响应，日志改为输出到标准错误）
+    if matches!(args.command, Commands::Daemon { .. }) {
+        tracing_subscriber::fmt().with_writer(std::io::stderr).init();
+    } else {
+        tracing_subscriber::fmt::init();
+    }
+
     match args.command {
         Commands::Process {
             input,
@@ -85,6 +104,9 @@ async fn main() -> Result<()> {
                 .await
                 .context("处理视频失败")?;
         }
+        Commands::Daemon { input, config: config_file } => {
+            run_daemon(&input, config_file.as_deref()).await?;
+        }
         Commands::Serve { bind } => {
             // Web 服务模式
             // 优先使用命令行参数，其次使用环境变量 FC_SERVER_PORT，最后使用默认值 9000
@@ -100,6 +122,58 @@ async fn main() -> Result<()> {
     Ok(())
 }
 
+/// 常驻模式的单个处理请求
+#[derive(Deserialize, Debug)]
+struct DaemonRequest {
+    output: String,
+    threshold: f64,
+    min_scene_duration: f64,
+    sample_rate: f64,
+}
+
+/// 常驻模式：逐行读取请求并处理，直到标准输入关闭
+async fn run_daemon(input: &str, config_file: Option<&Path>) -> Result<()> {
+    let mut lines = BufReader::new(tokio::io::stdin()).lines();
+    let mut stdout = tokio::io::stdout();
+
+    while let Some(line) = lines.next_line().await.context("读取标准输入失败")? {
+        if line.trim().is_empty() {
+            continue;
+        }
+
+        let response = match serde_json::from_str::<DaemonRequest>(&line) {
+            Ok(request) => match process_daemon_request(input, config_file, request).await {
+                Ok(scene_count) => serde_json::json!({ "success": true, "scene_count": scene_count }),
+                Err(e) => serde_json::json!({ "success": false, "error": format!("{:#}", e) }),
+            },
+            Err(e) => serde_json::json!({ "success": false, "error": format!("请求格式错误: {}", e) }),
+        };
+
+        stdout.write_all(format!("{}\n", response).as_bytes()).await.context("写入响应失败")?;
+        stdout.flush().await.context("写入响应失败")?;
+    }
+
+    Ok(())
+}
+
+/// 处理常驻模式的单个请求，返回检测到的场景数量
+async fn process_daemon_request(input: &str, config_file: Option<&Path>, request: DaemonRequest) -> Result<usize> {
+    let config = ConfigLoader::load_config(
+        config_file,
+        Some(request.threshold),
+        Some(request.min_scene_duration),
+        Some(request.sample_rate),
+        None, // webhook_url 从配置文件或环境变量读取
+    )
+    .context("加载配置失败")?;
+
+    let output = process_video(input, &request.output, config)
+        .await
+        .context("处理视频失败")?;
+
+    Ok(output.metadata.scene_count)
+}
+
 async fn start_web_server(bind: &str) -> Result<()> {
     use axum::{
         routing::{get, post, put, delete, patch, head, options, MethodRouter},
@@ -3,7 +3,7 @@ use image::DynamicImage;
 use anyhow::{Context, Result};
 use std::path::Path;
 use std::time::Instant;
-use std::io::{self, Write};
+use std::io::{self, IsTerminal, Write};
 
 /// 视频处理器，负责解码视频并提取帧
 pub struct VideoProcessor {
@@ -120,11 +120,15 @@ impl VideoProcessor {
         let mut last_log_time = Instant::now();
         let mut last_log_frame = 0;
         
-        println!("   📊 帧提取参数:");
-        println!("      • 预计提取帧数: {} 帧", num_frames);
-        println!("      • 视频时长: {:.2}秒", duration);
-        println!("      • 采样间隔: {:.3}秒", frame_interval);
-        println!("   🚀 开始提取视频帧...");
+        // 进度信息通过 tracing 输出，不直接写标准输出（常驻模式的标准输出用于返回响应）
+        tracing::info!("📊 帧提取参数:");
+        tracing::info!("   • 预计提取帧数: {} 帧", num_frames);
+        tracing::info!("   • 视频时长: {:.2}秒", duration);
+        tracing::info!("   • 采样间隔: {:.3}秒", frame_interval);
+        tracing::info!("🚀 开始提取视频帧...");
+        
+        // 进度条只在终端中显示（输出到标准错误），被脚本调用时不输出
+        let show_progress_bar = io::stderr().is_terminal();
         
         // 对每个需要提取的时间点进行 seek 和解码
         for i in 0..num_frames {
@@ -228,7 +232,7 @@ impl VideoProcessor {
             }
             
             // 显示进度条（每5%更新一次）
-            if (i + 1) % progress_interval == 0 || i == num_frames - 1 {
+            if show_progress_bar && ((i + 1) % progress_interval == 0 || i == num_frames - 1) {
                 let progress = ((i + 1) as f64 / num_frames as f64 * 100.0) as u32;
                 let elapsed = extract_start_time.elapsed();
                 let elapsed_secs = elapsed.as_secs_f64();
@@ -245,9 +249,9 @@ impl VideoProcessor {
                 let filled = (progress as f64 / 100.0 * bar_width as f64) as usize;
                 let bar = "█".repeat(filled) + &"░".repeat(bar_width - filled);
                 
-                print!("\r   📈 进度: [{}] {}% ({}/{}) | 已用: {:.1}s | 速度: {:.1} 帧/s | 剩余: {:.1}s     ", 
+                eprint!("\r   📈 进度: [{}] {}% ({}/{}) | 已用: {:.1}s | 速度: {:.1} 帧/s | 剩余: {:.1}s     ", 
                     bar, progress, i + 1, num_frames, elapsed_secs, fps, estimated_remaining);
-                io::stdout().flush().ok();
+                io::stderr().flush().ok();
             }
             
             // 输出详细日志（每10%输出一次）
@@ -267,7 +271,10 @@ impl VideoProcessor {
                 };
                 
                 // 输出详细日志（换行输出，不影响进度条）
-                println!("\n   📝 进度日志: {}% ({}/{}) | 已用: {:.1}s | 平均速度: {:.1} 帧/s | 当前速度: {:.1} 帧/s", 
+                if show_progress_bar {
+                    eprintln!();
+                }
+                tracing::info!("📝 进度日志: {}% ({}/{}) | 已用: {:.1}s | 平均速度: {:.1} 帧/s | 当前速度: {:.1} 帧/s", 
                     progress, i + 1, num_frames, elapsed_secs, avg_fps, recent_fps);
                 
                 last_log_frame = i + 1;
@@ -275,17 +282,19 @@ impl VideoProcessor {
             }
         }
         
-        println!(); // 换行，结束进度显示
+        if show_progress_bar {
+            eprintln!(); // 换行，结束进度显示
+        }
         
         // 输出提取完成总结
         let total_elapsed = extract_start_time.elapsed();
         let total_secs = total_elapsed.as_secs_f64();
         let avg_fps = frames.len() as f64 / total_secs.max(0.001);
-        println!("   ✅ 帧提取完成!");
-        println!("      • 成功提取: {} 帧", frames.len());
-        println!("      • 总耗时: {:.2}秒 ({:.0}ms)", total_secs, total_elapsed.as_millis());
-        println!("      • 平均速度: {:.2} 帧/秒", avg_fps);
-        println!("      • 平均耗时: {:.2}ms/帧", total_elapsed.as_millis() as f64 / frames.len().max(1) as f64);
+        tracing::info!("✅ 帧提取完成!");
+        tracing::info!("   • 成功提取: {} 帧", frames.len());
+        tracing::info!("   • 总耗时: {:.2}秒 ({:.0}ms)", total_secs, total_elapsed.as_millis());
+        tracing::info!("   • 平均速度: {:.2} 帧/秒", avg_fps);
+        tracing::info!("   • 平均耗时: {:.2}ms/帧", total_elapsed.as_millis() as f64 / frames.len().max(1) as f64);
         
         Ok(frames)
     }